@@ -47,8 +47,10 @@ def parseYamlOnPath(fileName, searchPath):
     """Find the named file in search path, parse the YAML, and return contents.
     """
     yamlFile = findYamlOnPath(fileName, searchPath)
-    with open(yamlFile) as fd:
-        content = yaml.load(fd, Loader=yaml.CSafeLoader)
+    # Read the whole file so libyaml parses a single buffer rather than
+    # calling back into Python for each chunk.
+    with open(yamlFile, "rb") as fd:
+        content = yaml.load(fd.read(), Loader=yaml.CSafeLoader)
     return content
 
 
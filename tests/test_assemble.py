@@ -29,9 +29,9 @@ from lsst.utils import getPackageDir
 from lsst.daf.butler import Butler
 from lsst.afw.cameraGeom import Detector
 from lsst.afw.image import ImageFitsReader
-import lsst.obs.base.yamlCamera as yamlCamera
 from lsst.ip.isr import AssembleCcdTask
 
+from lsst.obs.lsst import Latiss
 from lsst.obs.lsst.utils import readRawFile
 
 PACKAGE_DIR = getPackageDir("obs_lsst")
@@ -43,36 +43,68 @@ ITL_DATA_ID = {'raft': 'R02', 'name_in_raft': 'S02', 'exposure': 3019110102212,
 TESTDATA_ROOT = os.path.join(TESTDIR, "data")
 
 
+def _rawBBoxArray(detector):
+    """Pack the Raw bounding boxes of every amp into a single array.
+
+    Parameters
+    ----------
+    detector : `~lsst.afw.cameraGeom.Detector`
+        Detector whose amplifiers should be packed.
+
+    Returns
+    -------
+    boxes : `numpy.ndarray`
+        Array of shape ``(nAmps, 3, 4)`` holding the ``(minX, minY, maxX,
+        maxY)`` corners of the raw data, horizontal overscan and vertical
+        overscan bounding boxes of each amplifier.
+    """
+    return numpy.array([[(box.getMinX(), box.getMinY(), box.getMaxX(), box.getMaxY())
+                         for box in (amp.getRawBBox(), amp.getRawHorizontalOverscanBBox(),
+                                     amp.getRawVerticalOverscanBBox())]
+                        for amp in detector], dtype=numpy.int32)
+
+
 class RawAssemblyTestCase(lsst.utils.tests.TestCase):
     """Test assembly of each of data from each of the two
        manufacturers.  Data come from BOT spot data runs.
        """
 
-    def setUp(self):
-        # E2V and ITL detecotrs and expected assembled images
-        self.e2v = {'detector': Detector.readFits(os.path.join(TESTDATA_ROOT, 'e2v_detector.fits')),
-                    'expected': ImageFitsReader(os.path.join(TESTDATA_ROOT,
-                                                             'e2v_expected_assembled.fits.gz'))}
-        self.itl = {'detector': Detector.readFits(os.path.join(TESTDATA_ROOT, 'itl_detector.fits')),
-                    'expected': ImageFitsReader(os.path.join(TESTDATA_ROOT,
-                                                             'itl_expected_assembled.fits.gz'))}
-        self.roots = [BOT_DATA_ROOT, BOT_DATA_ROOT]
-        self.ids = [E2V_DATA_ID, ITL_DATA_ID]
-        self.expecteds = [self.e2v, self.itl]
-
-    def assertAmpRawBBoxesEqual(self, amp1, amp2):
-        """Check that Raw bounding boxes match between amps.
+    @classmethod
+    def setUpClass(cls):
+        # E2V and ITL detectors and expected assembled images. These are
+        # read-only fixtures so only read them once for all the tests.
+        cls.e2v = {'detector': Detector.readFits(os.path.join(TESTDATA_ROOT, 'e2v_detector.fits')),
+                   'expected': ImageFitsReader(os.path.join(TESTDATA_ROOT,
+                                                            'e2v_expected_assembled.fits.gz'))}
+        cls.itl = {'detector': Detector.readFits(os.path.join(TESTDATA_ROOT, 'itl_detector.fits')),
+                   'expected': ImageFitsReader(os.path.join(TESTDATA_ROOT,
+                                                            'itl_expected_assembled.fits.gz'))}
+        # Both detectors come from the same read-only repo so share one
+        # butler between all the tests.
+        cls.butler = Butler(BOT_DATA_ROOT, collections="LSSTCam/raw/all")
+        # Resolve the raw datasets once so each test only has to read them.
+        cls.cases = [(cls.butler.find_dataset("raw", did), expected)
+                     for did, expected in ((E2V_DATA_ID, cls.e2v), (ITL_DATA_ID, cls.itl))]
+
+    @classmethod
+    def tearDownClass(cls):
+        del cls.cases
+        cls.butler.close()
+        del cls.butler
+
+    def assertRawBBoxesEqual(self, detector1, detector2):
+        """Check that amp names and Raw bounding boxes match between
+        detectors.
 
         Parameters
         ----------
-        amp1 : `~lsst.afw.cameraGeom.Amplifier`
-            First amplifier.
-        amp2 : `~lsst.afw.cameraGeom.Amplifier`
-            Second amplifier.
+        detector1 : `~lsst.afw.cameraGeom.Detector`
+            First detector.
+        detector2 : `~lsst.afw.cameraGeom.Detector`
+            Second detector.
         """
-        self.assertEqual(amp1.getRawBBox(), amp2.getRawBBox())
-        self.assertEqual(amp1.getRawHorizontalOverscanBBox(), amp2.getRawHorizontalOverscanBBox())
-        self.assertEqual(amp1.getRawVerticalOverscanBBox(), amp2.getRawVerticalOverscanBBox())
+        self.assertEqual([amp.getName() for amp in detector1], [amp.getName() for amp in detector2])
+        numpy.testing.assert_array_equal(_rawBBoxArray(detector1), _rawBBoxArray(detector2))
 
     def assertAmpRawBBoxesFlippablyEqual(self, amp1, amp2):
         """Check that amp1 can be self-consistently transformed to match amp2.
@@ -122,22 +154,17 @@ class RawAssemblyTestCase(lsst.utils.tests.TestCase):
         """Test that the detector returned by the butler is the same
         as the expected one.
         """
-        for root, did, expected in zip(self.roots, self.ids, self.expecteds):
-            butler = Butler(root)
-            raw = butler.get("raw", dataId=did, collections="LSSTCam/raw/all")
-            for amp1, amp2 in zip(expected['detector'], raw.getDetector()):
-                with self.subTest(amp=amp1.getName()):
-                    self.assertEqual(amp1.getName(), amp2.getName())
-                    self.assertAmpRawBBoxesEqual(amp1, amp2)
+        for ref, expected in self.cases:
+            raw = self.butler.get(ref)
+            self.assertRawBBoxesEqual(expected['detector'], raw.getDetector())
 
     def testAssemble(self):
         """Test the assembly of E2V and ITL sensors
         """
         task = AssembleCcdTask()
         # exclude LATISS for this test since we don't have an expected output
-        for root, did, expected in zip(self.roots, self.ids, self.expecteds):
-            butler = Butler(root)
-            raw = butler.get("raw", dataId=did, collections="LSSTCam/raw/all")
+        for ref, expected in self.cases:
+            raw = self.butler.get(ref)
             assembled = task.assembleCcd(raw)
             count = numpy.sum(expected['expected'].read().array - assembled.getImage().array)
             self.assertEqual(count, 0)
@@ -146,8 +173,8 @@ class RawAssemblyTestCase(lsst.utils.tests.TestCase):
 class ReadRawFileTestCase(lsst.utils.tests.TestCase):
     def testReadRawLatissFile(self):
         fileName = os.path.join(LATISS_DATA_ROOT, "raw/2018-09-20/3018092000065-det000.fits")
-        policy = os.path.join(PACKAGE_DIR, "policy", "latiss.yaml")
-        camera = yamlCamera.makeCamera(policy)
+        # Latiss.getCamera relies on yamlCamera caching the parsed camera.
+        camera = Latiss.getCamera()
         exposure = readRawFile(fileName, camera[0], dataId={"file": fileName})
         self.assertIsInstance(exposure, lsst.afw.image.Exposure)
         md = exposure.getMetadata()
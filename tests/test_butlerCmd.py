@@ -28,40 +28,15 @@ import lsst.utils.tests
 from lsst.obs.base.cli.butler_cmd_test import ButlerCmdTestBase
 
 
-class TestButlerCmdLsstComCam(ButlerCmdTestBase, lsst.utils.tests.TestCase):
-    instrumentClassName = "lsst.obs.lsst.LsstComCam"
-
-
-class TestButlerCmdLsstComCamSim(ButlerCmdTestBase, lsst.utils.tests.TestCase):
-    instrumentClassName = "lsst.obs.lsst.LsstComCamSim"
-
-
-class TestButlerCmdLsstCamImSim(ButlerCmdTestBase, lsst.utils.tests.TestCase):
-    instrumentClassName = "lsst.obs.lsst.LsstCamImSim"
-
-
-class TestButlerCmdLsstCamPhoSim(ButlerCmdTestBase, lsst.utils.tests.TestCase):
-    instrumentClassName = "lsst.obs.lsst.LsstCamPhoSim"
-
-
-class TestButlerCmdLsstCamSim(ButlerCmdTestBase, lsst.utils.tests.TestCase):
-    instrumentClassName = "lsst.obs.lsst.LsstCamSim"
-
-
-class TestButlerCmdLsstTS8(ButlerCmdTestBase, lsst.utils.tests.TestCase):
-    instrumentClassName = "lsst.obs.lsst.LsstTS8"
-
-
-class TestButlerCmdLsstUCDCam(ButlerCmdTestBase, lsst.utils.tests.TestCase):
-    instrumentClassName = "lsst.obs.lsst.LsstUCDCam"
-
-
-class TestButlerCmdLsstTS3(ButlerCmdTestBase, lsst.utils.tests.TestCase):
-    instrumentClassName = "lsst.obs.lsst.LsstTS3"
-
-
-class TestButlerCmdLatiss(ButlerCmdTestBase, lsst.utils.tests.TestCase):
-    instrumentClassName = "lsst.obs.lsst.Latiss"
+# Each instrument gets its own TestCase subclass so that unittest and pytest
+# discovery report failures per instrument.
+for _instrumentName in ("LsstComCam", "LsstComCamSim", "LsstCamImSim", "LsstCamPhoSim", "LsstCamSim",
+                        "LsstTS8", "LsstUCDCam", "LsstTS3", "Latiss"):
+    _className = f"TestButlerCmd{_instrumentName}"
+    globals()[_className] = type(_className, (ButlerCmdTestBase, lsst.utils.tests.TestCase),
+                                 {"instrumentClassName": f"lsst.obs.lsst.{_instrumentName}",
+                                  "__module__": __name__})
+del _instrumentName, _className
 
 
 class TestMultiple(ButlerCmdTestBase, lsst.utils.tests.TestCase):
@@ -20,14 +20,12 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import os
+import random
 import unittest
-import shutil
 import tempfile
 from cProfile import Profile
 from pstats import Stats
 
-import numpy as np
-
 from astro_metadata_translator import ObservationInfo
 from lsst.obs.lsst import (LsstCam, LsstComCam, LsstCamImSim, LsstCamPhoSim,
                            LsstTS8, LsstTS3, LsstUCDCam, Latiss, LsstComCamSim,
@@ -50,19 +48,45 @@ PRINT_PROFILE = False
 
 class TestInstruments(unittest.TestCase):
 
-    def setUp(self):
-        self.root = tempfile.mkdtemp(dir=TESTDIR)
-        self.rng = np.random.RandomState(50)  # arbitrary deterministic seed
-
     @classmethod
     def setUpClass(cls):
         if PRINT_PROFILE:
             cls.profile = Profile()
             cls.profile.enable()
+        # Every instrument can be registered in the same repo, so only pay
+        # for creating the registry once.  Each test writes to its own run.
+        # Use the system temporary directory, which is usually on faster
+        # storage than the source tree.
+        tmpdir = tempfile.TemporaryDirectory(prefix="obs_lsst_gen3_", ignore_cleanup_errors=True)
+        cls.addClassCleanup(tmpdir.cleanup)
+        cls.root = tmpdir.name
+        Butler.makeRepo(cls.root)
+        butler = Butler(cls.root, writeable=True)
+        scFactory = StorageClassFactory()
+
+        # Define a DatasetType for the cameraGeom.Camera, which can be
+        # accessed just by identifying its Instrument.
+        # A real-world Camera DatasetType should be identified by a
+        # validity range as well.
+        cameraDatasetType = DatasetType("camera", dimensions=["instrument"],
+                                        storageClass=scFactory.getStorageClass("Camera"),
+                                        universe=butler.dimensions)
+        butler.registry.registerDatasetType(cameraDatasetType)
 
-    def tearDown(self):
-        if self.root is not None and os.path.exists(self.root):
-            shutil.rmtree(self.root, ignore_errors=True)
+        # Define a DatasetType for cameraGeom.Detectors, which can be
+        # accessed by identifying its Instrument and (Butler) Detector.
+        # A real-world Detector DatasetType probably doesn't need to exist,
+        # as  it would just duplicate information in the Camera, and
+        # reading a full Camera just to get a single Detector should be
+        # plenty efficient.
+        detectorDatasetType = DatasetType("detector", dimensions=["instrument", "detector"],
+                                          storageClass=scFactory.getStorageClass("Detector"),
+                                          universe=butler.dimensions)
+        butler.registry.registerDatasetType(detectorDatasetType)
+        butler.close()
+
+    def setUp(self):
+        self.rng = random.Random(50)  # arbitrary deterministic seed
 
     @classmethod
     def tearDownClass(cls):
@@ -74,10 +98,11 @@ class TestInstruments(unittest.TestCase):
 
     def checkInstrumentWithRegistry(self, cls, testRaw):
 
-        Butler.makeRepo(self.root)
-        butler = Butler(self.root, run="tests")
+        butler = Butler(self.root, run=f"tests/{self._testMethodName}")
+        self.addCleanup(butler.close)
         instrument = cls()
-        scFactory = StorageClassFactory()
+        # The camera is immutable so only ask the instrument for it once.
+        instrumentCamera = instrument.getCamera()
 
         # Check instrument class and metadata translator agree on
         # instrument name, using readRawFitsHeader to read the metadata.
@@ -90,44 +115,33 @@ class TestInstruments(unittest.TestCase):
         # Butler Registry.
         instrument.register(butler.registry)
 
-        # Define a DatasetType for the cameraGeom.Camera, which can be
-        # accessed just by identifying its Instrument.
-        # A real-world Camera DatasetType should be identified by a
-        # validity range as well.
-        cameraDatasetType = DatasetType("camera", dimensions=["instrument"],
-                                        storageClass=scFactory.getStorageClass("Camera"),
-                                        universe=butler.dimensions)
-        butler.registry.registerDatasetType(cameraDatasetType)
-
-        # Define a DatasetType for cameraGeom.Detectors, which can be
-        # accessed by identifying its Instrument and (Butler) Detector.
-        # A real-world Detector DatasetType probably doesn't need to exist,
-        # as  it would just duplicate information in the Camera, and
-        # reading a full Camera just to get a single Detector should be
-        # plenty efficient.
-        detectorDatasetType = DatasetType("detector", dimensions=["instrument", "detector"],
-                                          storageClass=scFactory.getStorageClass("Detector"),
-                                          universe=butler.dimensions)
-        butler.registry.registerDatasetType(detectorDatasetType)
-
-        # Put and get the Camera.
-        dataId = dict(instrument=instrument.instrument)
-        butler.put(instrument.getCamera(), "camera", dataId=dataId)
-        camera = butler.get("camera", dataId)
+        # Pick a random subset of the Detectors.
+        # Sample the IDs so only the chosen Detectors are looked up.
+        allDetectorIds = sorted(instrumentCamera.getIdIter())
+        numDetectors = min(3, len(allDetectorIds))
+        someDetectors = [instrumentCamera[detectorId]
+                         for detectorId in self.rng.sample(allDetectorIds, numDetectors)]
+
+        # Put the Camera and the Detectors in a single transaction.
+        # Registration above has to happen outside of a transaction.
+        cameraDataId = dict(instrument=instrument.instrument)
+        # Right now we only support integer detector IDs in data IDs;
+        # support for detector names and groups (i.e. rafts) is
+        # definitely planned but not yet implemented.
+        detectorDataIds = [dict(instrument=instrument.instrument, detector=cameraGeomDetector.getId())
+                           for cameraGeomDetector in someDetectors]
+        with butler.transaction():
+            butler.put(instrumentCamera, "camera", dataId=cameraDataId)
+            for cameraGeomDetector, dataId in zip(someDetectors, detectorDataIds):
+                butler.put(cameraGeomDetector, "detector", dataId=dataId)
+
+        # Get the Camera back.
+        camera = butler.get("camera", cameraDataId)
         # Full camera comparisons are *slow*; just compare names.
-        self.assertEqual(instrument.getCamera().getName(), camera.getName())
-
-        # Put and get a random subset of the Detectors.
-        allDetectors = list(instrument.getCamera())
-        numDetectors = min(3, len(allDetectors))
-        someDetectors = [allDetectors[i] for i in self.rng.choice(len(allDetectors),
-                                                                  size=numDetectors, replace=False)]
-        for cameraGeomDetector in someDetectors:
-            # Right now we only support integer detector IDs in data IDs;
-            # support for detector names and groups (i.e. rafts) is
-            # definitely planned but not yet implemented.
-            dataId = dict(instrument=instrument.instrument, detector=cameraGeomDetector.getId())
-            butler.put(cameraGeomDetector, "detector", dataId=dataId)
+        self.assertEqual(instrumentCamera.getName(), camera.getName())
+
+        # Get the Detectors back.
+        for cameraGeomDetector, dataId in zip(someDetectors, detectorDataIds):
             cameraGeomDetector2 = butler.get("detector", dataId=dataId)
             # Full detector comparisons are *slow*; just compare names and
             # serials.
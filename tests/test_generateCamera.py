@@ -21,6 +21,7 @@
 
 """Test the generateCamera.py script"""
 
+import contextlib
 import unittest
 import os
 import shutil
@@ -33,16 +34,25 @@ from lsst.obs.lsst.script.generateCamera import generateCamera, parseYamlOnPath
 
 TESTDIR = os.path.abspath(os.path.dirname(__file__))
 POLICYDIR = os.path.normpath(os.path.join(TESTDIR, os.path.pardir, 'policy'))
+CAMERA_YAML_FILE = "testCamera.yaml"
+REQUIRED_KEYS = frozenset({"CCDs", "AMP_E2V", "AMP_ITL", "CCD_ITL", "CCD_E2V", "RAFT_ITL", "RAFT_E2V",
+                           "transforms"})
 
 
 class PhosimToRaftsTestCase(lsst.utils.tests.ExecutablesTestCase):
     """Test the generateCamera.py utility script."""
 
-    def setUp(self):
-        self.testdir = mkdtemp(dir=TESTDIR)
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Each test only writes a single camera file so share one directory
+        # and only remove that file between tests.
+        cls.testdir = mkdtemp(dir=TESTDIR)
+        cls.addClassCleanup(shutil.rmtree, cls.testdir, ignore_errors=True)
 
     def tearDown(self):
-        shutil.rmtree(self.testdir, ignore_errors=True)
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(os.path.join(self.testdir, CAMERA_YAML_FILE))
 
     def runGenerateCamera(self, searchPath):
         """Run generateCamera with the provided path.
@@ -57,19 +67,16 @@ class PhosimToRaftsTestCase(lsst.utils.tests.ExecutablesTestCase):
         content : `dict`
             The content from the generated camera.
         """
-        camera = "testCamera"
-        cameraYamlFile = f"{camera}.yaml"
-        outfile = os.path.join(self.testdir, cameraYamlFile)
+        outfile = os.path.join(self.testdir, CAMERA_YAML_FILE)
         searchPath = (os.path.normpath(os.path.join(POLICYDIR, f)) for f in searchPath)
         generateCamera(outfile, searchPath)
         self.assertTrue(os.path.exists(outfile))
 
-        content = parseYamlOnPath(cameraYamlFile, [self.testdir])
+        content = parseYamlOnPath(CAMERA_YAML_FILE, [self.testdir])
 
         # Check that some top level keys exist
-        for k in ("CCDs", "AMP_E2V", "AMP_ITL", "CCD_ITL", "CCD_E2V", "RAFT_ITL", "RAFT_E2V",
-                  "transforms"):
-            self.assertIn(k, content)
+        missing = REQUIRED_KEYS.difference(content)
+        self.assertFalse(missing, f"Missing top level keys: {sorted(missing)}")
 
         return content
 
@@ -21,9 +21,9 @@
 #
 
 import os
+import shutil
 import unittest
-import contextlib
-from lsst.daf.butler import MissingDatasetTypeError, Config
+from lsst.daf.butler import Butler, MissingDatasetTypeError, Config
 from lsst.daf.butler.tests import makeTestRepo
 from lsst.daf.butler.tests.utils import makeTestTempDir, removeTestTempDir
 from lsst.obs.lsst import LsstCam, ingest_guider
@@ -31,22 +31,38 @@ from lsst.obs.base import RawIngestTask
 
 TESTDIR = os.path.abspath(os.path.dirname(__file__))
 DATAROOT = os.path.join(TESTDIR, os.path.pardir, "data", "input", "guider")
+UNDEFINED_EXPOSURE_GUIDER_FILE = os.path.join(DATAROOT, "guider_data", "MC_C_20230616_000013_R04_SG0.fits")
+RAW_FILE = os.path.join(DATAROOT, "raw", "MC_C_20240918_000013_R42_S11.fits")
+GUIDER_FILE = os.path.join(DATAROOT, "guider_data", "MC_C_20240918_000013_R00_SG0_guider.fits")
 
 
 class GuiderIngestTestCase(unittest.TestCase):
     """Test guider file ingest."""
 
-    def setUp(self):
-        # Repository should be re-created for each test case since
-        # dimension records are set.
-        self.root = makeTestTempDir(TESTDIR)
-        self.addClassCleanup(removeTestTempDir, self.root)
+    @classmethod
+    def setUpClass(cls):
+        # Registering the instrument is the expensive part of making a repo
+        # so do that once in a template repository.
+        cls.template_root = makeTestTempDir(TESTDIR)
+        cls.addClassCleanup(removeTestTempDir, cls.template_root)
 
         config = Config()
         config["datastore", "cls"] = "lsst.daf.butler.datastores.fileDatastore.FileDatastore"
-        self.butler = makeTestRepo(self.root, config=config)
-        self.instrument = LsstCam()
-        self.instrument.register(self.butler.registry)
+        butler = makeTestRepo(cls.template_root, config=config)
+        cls.instrument = LsstCam()
+        cls.instrument.register(butler.registry)
+        butler.close()
+
+    def setUp(self):
+        # Repository should be re-created for each test case since
+        # dimension records and dataset types are set, so start each test
+        # from a copy of the template.
+        self.root = makeTestTempDir(TESTDIR)
+        self.addCleanup(removeTestTempDir, self.root)
+        repo = os.path.join(self.root, "repo")
+        shutil.copytree(self.template_root, repo)
+        self.butler = Butler(repo, writeable=True)
+        self.addCleanup(self.butler.close)
 
     def test_ingest_guider_fail(self):
 
@@ -58,14 +74,15 @@ class GuiderIngestTestCase(unittest.TestCase):
         with self.assertRaises(MissingDatasetTypeError):
             ingest_guider(
                 self.butler,
-                [os.path.join(DATAROOT, "guider_data", "MC_C_20230616_000013_R04_SG0.fits")],
+                [UNDEFINED_EXPOSURE_GUIDER_FILE],
                 on_undefined_exposure=on_undefined_exposure,
             )
 
-        with contextlib.suppress(Exception):
+        # The file can not be ingested without its exposure record.
+        with self.assertRaisesRegex(RuntimeError, "Failed to ingest 1 file"):
             ingest_guider(
                 self.butler,
-                [os.path.join(DATAROOT, "guider_data", "MC_C_20230616_000013_R04_SG0.fits")],
+                [UNDEFINED_EXPOSURE_GUIDER_FILE],
                 register_dataset_type=True,
                 on_undefined_exposure=on_undefined_exposure,
             )
@@ -78,7 +95,7 @@ class GuiderIngestTestCase(unittest.TestCase):
         config = RawIngestTask.ConfigClass()
         task = RawIngestTask(config=config, butler=self.butler)
         # This will read the metadata from the sidecar file.
-        task.run([os.path.join(DATAROOT, "raw", "MC_C_20240918_000013_R42_S11.fits")])
+        task.run([RAW_FILE])
 
         ingested = []
 
@@ -88,7 +105,7 @@ class GuiderIngestTestCase(unittest.TestCase):
         # Ingest guider data.
         refs = ingest_guider(
             self.butler,
-            [os.path.join(DATAROOT, "guider_data", "MC_C_20240918_000013_R00_SG0_guider.fits")],
+            [GUIDER_FILE],
             group_files=False,
             register_dataset_type=True,
             on_success=on_success,
@@ -29,6 +29,41 @@ import lsst.afw.image
 from lsst.obs.lsst.testHelper import ObsLsstButlerTests, ObsLsstObsBaseOverrides
 from lsst.obs.lsst import LsstCamImSim
 
+DATASET_TYPES = ('raw', 'bias', 'dark', 'flat')
+DATA_IDS = {'raw': {'exposure': 204595, 'name_in_raft': 'S20', 'raft': 'R11'},
+            'bias': {'exposure': 204595, 'name_in_raft': 'S20', 'raft': 'R11'},
+            'flat': {'exposure': 204595, 'name_in_raft': 'S20', 'raft': 'R11',
+                     'physical_filter': 'i_sim_1.4'},
+            'dark': {'exposure': 204595, 'name_in_raft': 'S20', 'raft': 'R11'}
+            }
+CCD_EXPOSURE_ID_BITS = 34
+EXPOSURE_IDS = dict.fromkeys(DATASET_TYPES, 204595042)
+FILTERS = {'raw': 'i_sim_1.4',
+           'bias': '_unknown_',
+           'dark': '_unknown_',
+           'flat': 'i_sim_1.4'
+           }
+EXPTIMES = {'raw': 30.0,
+            'bias': 0.0,
+            'dark': 1.0,
+            'flat': 1.0
+            }
+DETECTOR_IDS = dict.fromkeys(DATASET_TYPES, 42)
+DETECTOR_NAMES = dict.fromkeys(DATASET_TYPES, 'R11_S20')
+DETECTOR_SERIALS = dict.fromkeys(DATASET_TYPES, 'ITL-3800C-102-Dev')
+DIMENSIONS = {'raw': Extent2I(4352, 4096),
+              'bias': Extent2I(4072, 4000),
+              'dark': Extent2I(4072, 4000),
+              'flat': Extent2I(4072, 4000),
+              }
+SKY_ORIGIN = (55.67759886, -30.44239357)
+RAW_SUBSETS = (({}, 1),
+               ({'physical_filter': 'i_sim_1.4'}, 1),
+               ({'physical_filter': 'foo'}, 0),
+               ({'exposure': 204595}, 1),
+               ({'exposure': 204595}, 1),
+               )
+
 
 class TestImsim(ObsLsstObsBaseOverrides, ObsLsstButlerTests):
     instrumentDir = "imsim"
@@ -38,69 +73,19 @@ class TestImsim(ObsLsstObsBaseOverrides, ObsLsstButlerTests):
         return LsstCamImSim()
 
     def setUp(self):
-        dataIds = {'raw': {'exposure': 204595, 'name_in_raft': 'S20', 'raft': 'R11'},
-                   'bias': {'exposure': 204595, 'name_in_raft': 'S20', 'raft': 'R11'},
-                   'flat': {'exposure': 204595, 'name_in_raft': 'S20', 'raft': 'R11',
-                            'physical_filter': 'i_sim_1.4'},
-                   'dark': {'exposure': 204595, 'name_in_raft': 'S20', 'raft': 'R11'}
-                   }
-        self.setUp_tests(self._butler, dataIds)
-
-        ccdExposureId_bits = 34
-        exposureIds = {'raw': 204595042,
-                       'bias': 204595042,
-                       'dark': 204595042,
-                       'flat': 204595042
-                       }
-        filters = {'raw': 'i_sim_1.4',
-                   'bias': '_unknown_',
-                   'dark': '_unknown_',
-                   'flat': 'i_sim_1.4'
-                   }
-        exptimes = {'raw': 30.0,
-                    'bias': 0.0,
-                    'dark': 1.0,
-                    'flat': 1.0
-                    }
-        detectorIds = {'raw': 42,
-                       'bias': 42,
-                       'dark': 42,
-                       'flat': 42
-                       }
-        detector_names = {'raw': 'R11_S20',
-                          'bias': 'R11_S20',
-                          'dark': 'R11_S20',
-                          'flat': 'R11_S20'
-                          }
-        detector_serials = {'raw': 'ITL-3800C-102-Dev',
-                            'bias': 'ITL-3800C-102-Dev',
-                            'dark': 'ITL-3800C-102-Dev',
-                            'flat': 'ITL-3800C-102-Dev'
-                            }
-        dimensions = {'raw': Extent2I(4352, 4096),
-                      'bias': Extent2I(4072, 4000),
-                      'dark': Extent2I(4072, 4000),
-                      'flat': Extent2I(4072, 4000),
-                      }
-        sky_origin = (55.67759886, -30.44239357)
-        raw_subsets = (({}, 1),
-                       ({'physical_filter': 'i_sim_1.4'}, 1),
-                       ({'physical_filter': 'foo'}, 0),
-                       ({'exposure': 204595}, 1),
-                       ({'exposure': 204595}, 1),
-                       )
-        linearizer_type = unittest.SkipTest
-        self.setUp_butler_get(ccdExposureId_bits=ccdExposureId_bits,
-                              exposureIds=exposureIds,
-                              filters=filters,
-                              exptimes=exptimes,
-                              detectorIds=detectorIds,
-                              detector_names=detector_names,
-                              detector_serials=detector_serials,
-                              dimensions=dimensions,
-                              sky_origin=sky_origin,
-                              raw_subsets=raw_subsets,
-                              linearizer_type=linearizer_type
+        self.setUp_tests(self._butler, DATA_IDS)
+
+        self.setUp_butler_get(ccdExposureId_bits=CCD_EXPOSURE_ID_BITS,
+                              exposureIds=EXPOSURE_IDS,
+                              filters=FILTERS,
+                              exptimes=EXPTIMES,
+                              detectorIds=DETECTOR_IDS,
+                              detector_names=DETECTOR_NAMES,
+                              detector_serials=DETECTOR_SERIALS,
+                              dimensions=DIMENSIONS,
+                              sky_origin=SKY_ORIGIN,
+                              raw_subsets=RAW_SUBSETS,
+                              linearizer_type=unittest.SkipTest
                               )
 
         self.raw_filename = '00204595-R11-S20-det042.fits'
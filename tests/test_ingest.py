@@ -24,6 +24,7 @@
 
 import unittest
 import os
+import shutil
 import tempfile
 import lsst.utils.tests
 
@@ -32,8 +33,11 @@ from lsst.afw.cameraGeom import AmplifierGeometryComparison
 from lsst.daf.butler import Butler, DataCoordinate
 from lsst.daf.butler.cli.butler import cli as butlerCli
 from lsst.daf.butler.cli.utils import LogCliRunner
+from lsst.daf.butler.tests.utils import makeTestTempDir, removeTestTempDir
+from lsst.obs.base import RawIngestTask
 from lsst.obs.base.ingest_tests import IngestTestBase
 from lsst.ip.isr import PhotodiodeCalib
+from lsst.utils import doImportType
 import lsst.afw.cameraGeom.testUtils  # for injected test asserts
 import lsst.obs.lsst
 
@@ -57,6 +61,7 @@ class LatissIngestTestCase(IngestTestBase, lsst.utils.tests.TestCase):
         butler = Butler(self.root, run=self.outputRun)
         ref = butler.find_dataset("raw", self.dataIds[0])
         full_assembled = butler.get(ref)
+        full_image = full_assembled.image
         unassembled_detector = self.instrumentClass().getCamera()[ref.dataId["detector"]]
         assembled_detector = full_assembled.getDetector()
         for unassembled_amp, assembled_amp in zip(unassembled_detector, assembled_detector):
@@ -68,35 +73,34 @@ class LatissIngestTestCase(IngestTestBase, lsst.utils.tests.TestCase):
             self.assertTrue(comparison & AmplifierGeometryComparison.ASSEMBLY_DIFFERS)
             assembled_subimage = butler.get(ref, parameters={"amp": assembled_amp})
             unassembled_subimage = butler.get(ref, parameters={"amp": unassembled_amp.getName()})
-            self.assertEqual(len(assembled_subimage.getDetector()), 1)
-            self.assertEqual(len(unassembled_subimage.getDetector()), 1)
-            self.assertEqual(len(assembled_subimage.getDetector()), 1)
-            self.assertEqual(len(unassembled_subimage.getDetector()), 1)
-            self.assertImagesEqual(assembled_subimage.image, full_assembled.image[assembled_amp.getRawBBox()])
-            self.assertImagesEqual(
-                unassembled_subimage.image,
-                flipImage(
-                    full_assembled.image[assembled_amp.getRawBBox()],
-                    flipLR=unassembled_amp.getRawFlipX(),
-                    flipTB=unassembled_amp.getRawFlipY(),
-                ),
-            )
-            self.assertAmplifiersEqual(assembled_subimage.getDetector()[0], assembled_amp)
+            assembled_subdetector = assembled_subimage.getDetector()
+            unassembled_subdetector = unassembled_subimage.getDetector()
+            self.assertEqual(len(assembled_subdetector), 1)
+            self.assertEqual(len(unassembled_subdetector), 1)
+            raw_bbox = assembled_amp.getRawBBox()
+            amp_image = full_image[raw_bbox]
+            self.assertImagesEqual(assembled_subimage.image, amp_image)
+            flipLR = unassembled_amp.getRawFlipX()
+            flipTB = unassembled_amp.getRawFlipY()
+            if flipLR or flipTB:
+                amp_image = flipImage(amp_image, flipLR=flipLR, flipTB=flipTB)
+            self.assertImagesEqual(unassembled_subimage.image, amp_image)
+            self.assertAmplifiersEqual(assembled_subdetector[0], assembled_amp)
             if comparison & comparison.REGIONS_DIFFER:
                 # We needed to patch overscans, but unassembled_amp (which
                 # comes straight from the camera) won't have those patches, so
                 # we can't compare it to the amp attached to
                 # unassembled_subimage (which does have those patches).
-                comparison2 = unassembled_subimage.getDetector()[0].compareGeometry(unassembled_amp)
+                comparison2 = unassembled_subdetector[0].compareGeometry(unassembled_amp)
 
                 self.assertTrue(comparison2 & AmplifierGeometryComparison.REGIONS_DIFFER)
                 # ...and that unassembled_subimage's amp has the same regions
                 # (after accounting for assembly/orientation) as assembled_amp.
-                comparison3 = unassembled_subimage.getDetector()[0].compareGeometry(assembled_amp)
+                comparison3 = unassembled_subdetector[0].compareGeometry(assembled_amp)
                 self.assertTrue(comparison3 & AmplifierGeometryComparison.ASSEMBLY_DIFFERS)
                 self.assertFalse(comparison3 & AmplifierGeometryComparison.REGIONS_DIFFER)
             else:
-                self.assertAmplifiersEqual(unassembled_subimage.getDetector()[0], unassembled_amp)
+                self.assertAmplifiersEqual(unassembled_subdetector[0], unassembled_amp)
 
 
 class Ts3IngestTestCase(IngestTestBase, lsst.utils.tests.TestCase):
@@ -189,30 +193,39 @@ class LSSTCamSimIngestTestCase(IngestTestBase, lsst.utils.tests.TestCase):
 
 class LSSTCamPhotodiodeIngestTestCase(lsst.utils.tests.TestCase):
     instrumentClassName = "lsst.obs.lsst.LsstCam"
-    rawIngestTask = "lsst.obs.base.RawIngestTask"
-    ingestDir = TESTDIR
     file = os.path.join(DATAROOT, "lsstCam", "raw", "2021-12-12",
                         "30211212000310", "30211212000310-R22-S22-det098.fits")
     dataIds = [dict(instrument="LSSTCam", exposure=3021121200310, detector=98)]
     filterLabel = lsst.afw.image.FilterLabel(physical="SDSSi", band="i")
     pdPath = os.path.join(DATAROOT, "lsstCam", "raw")
 
-    def setUp(self):
-        """Setup for lightweight photodiode ingest task.
+    @classmethod
+    def setUpClass(cls):
+        """Create a template repo with the instrument registered.
 
-        This will create the repo and register the instrument.
+        Each test starts from a copy of this so that the repo only has to
+        be created and the instrument registered once.
         """
-        self.root = tempfile.mkdtemp(dir=self.ingestDir)
+        # These repos are thrown away so keep them in the system
+        # temporary directory rather than the source tree.
+        cls.template_root = makeTestTempDir(tempfile.gettempdir())
+        cls.addClassCleanup(removeTestTempDir, cls.template_root)
 
-        # Create Repo
-        runner = LogCliRunner()
-        result = runner.invoke(butlerCli, ["create", self.root])
-        self.assertEqual(result.exit_code, 0, f"output: {result.output} exception: {result.exception}")
+        # Create the repo and register the instrument directly; the CLI
+        # wiring is covered by the photodiode ingest below.
+        Butler.makeRepo(cls.template_root)
+        with Butler(cls.template_root, writeable=True) as butler:
+            doImportType(cls.instrumentClassName)().register(butler.registry)
 
-        # Register Instrument
-        runner = LogCliRunner()
-        result = runner.invoke(butlerCli, ["register-instrument", self.root, self.instrumentClassName])
-        self.assertEqual(result.exit_code, 0, f"output: {result.output} exception: {result.exception}")
+    def setUp(self):
+        """Setup for lightweight photodiode ingest task.
+
+        This will copy the template repo with the instrument registered.
+        """
+        self.root = makeTestTempDir(tempfile.gettempdir())
+        self.addCleanup(removeTestTempDir, self.root)
+        self.repo = os.path.join(self.root, "repo")
+        shutil.copytree(self.template_root, self.repo)
 
     def testPhotodiodeFailure(self):
         """Test ingest to a repo missing exposure information will raise.
@@ -222,7 +235,7 @@ class LSSTCamPhotodiodeIngestTestCase(lsst.utils.tests.TestCase):
             butlerCli,
             [
                 "ingest-photodiode",
-                self.root,
+                self.repo,
                 self.instrumentClassName,
                 self.pdPath,
             ],
@@ -233,21 +246,12 @@ class LSSTCamPhotodiodeIngestTestCase(lsst.utils.tests.TestCase):
         """Test ingest to a repo with the exposure information will not raise.
         """
         # Ingest raw to provide exposure information.
-        outputRun = "raw_ingest_" + self.id()
-        runner = LogCliRunner()
-        result = runner.invoke(
-            butlerCli,
-            [
-                "ingest-raws",
-                self.root,
-                self.file,
-                "--output-run",
-                outputRun,
-                "--ingest-task",
-                self.rawIngestTask,
-            ],
-        )
-        self.assertEqual(result.exit_code, 0, f"output: {result.output} exception: {result.exception}")
+        # Only the exposure record is needed, so avoid copying the raw.
+        config = RawIngestTask.ConfigClass()
+        config.transfer = "symlink"
+        with Butler(self.repo, run="raw_ingest_" + self.id()) as butler:
+            task = RawIngestTask(config=config, butler=butler)
+            task.run([self.file])
 
         # Ingest photodiode matching this exposure.
         runner = LogCliRunner()
@@ -255,7 +259,7 @@ class LSSTCamPhotodiodeIngestTestCase(lsst.utils.tests.TestCase):
             butlerCli,
             [
                 "ingest-photodiode",
-                self.root,
+                self.repo,
                 self.instrumentClassName,
                 self.pdPath,
             ],
@@ -264,8 +268,8 @@ class LSSTCamPhotodiodeIngestTestCase(lsst.utils.tests.TestCase):
 
         # Confirm that we can retrieve the ingested photodiode, and
         # that it has the correct type.
-        butler = Butler(self.root, run="LSSTCam/calib/photodiode")
-        getResult = butler.get('photodiode', dataId=self.dataIds[0])
+        with Butler(self.repo, run="LSSTCam/calib/photodiode") as butler:
+            getResult = butler.get('photodiode', dataId=self.dataIds[0])
         self.assertIsInstance(getResult, PhotodiodeCalib)
 
 
@@ -29,6 +29,28 @@ import lsst.afw.image
 from lsst.obs.lsst.testHelper import ObsLsstButlerTests, ObsLsstObsBaseOverrides
 from lsst.obs.lsst import Latiss
 
+DATA_IDS = {'raw': {'exposure': 3018092000065, 'detector': 0},
+            'bias': {'detector': 0, 'exposure': 3018092000065},
+            'flat': unittest.SkipTest,
+            'dark': unittest.SkipTest
+            }
+CCD_EXPOSURE_ID_BITS = 52
+EXPOSURE_IDS = {'raw': 3018092000065, 'bias': 3018092000065}
+FILTERS = {'raw': 'unknown~unknown', 'bias': '_unknown_'}
+EXPTIMES = {'raw': 27.0, 'bias': 0}
+DETECTOR_IDS = {'raw': 0, 'bias': 0}
+DETECTOR_NAMES = {'raw': 'RXX_S00', 'bias': 'RXX_S00'}
+DETECTOR_SERIALS = {'raw': 'ITL-3800C-068', 'bias': 'ITL-3800C-098'}
+DIMENSIONS = {'raw': Extent2I(4608, 4096),
+              'bias': Extent2I(4072, 4000)}
+RAW_SUBSETS = (({}, 1),
+               ({'physical_filter': 'unknown~unknown'}, 1),
+               ({'physical_filter': 'SDSSg'}, 0),
+               ({'exposure.day_obs': 20180920}, 1),
+               ({'exposure': 3018092000065}, 1),
+               ({'exposure': 9999999999999}, 0),
+               )
+
 
 class TestLatiss(ObsLsstObsBaseOverrides, ObsLsstButlerTests):
     instrumentDir = "latiss"
@@ -38,42 +60,19 @@ class TestLatiss(ObsLsstObsBaseOverrides, ObsLsstButlerTests):
         return Latiss()
 
     def setUp(self):
-        dataIds = {'raw': {'exposure': 3018092000065, 'detector': 0},
-                   'bias': {'detector': 0, 'exposure': 3018092000065},
-                   'flat': unittest.SkipTest,
-                   'dark': unittest.SkipTest
-                   }
-        self.setUp_tests(self._butler, dataIds)
-
-        ccdExposureId_bits = 52
-        exposureIds = {'raw': 3018092000065, 'bias': 3018092000065}
-        filters = {'raw': 'unknown~unknown', 'bias': '_unknown_'}
-        exptimes = {'raw': 27.0, 'bias': 0}
-        detectorIds = {'raw': 0, 'bias': 0}
-        detector_names = {'raw': 'RXX_S00', 'bias': 'RXX_S00'}
-        detector_serials = {'raw': 'ITL-3800C-068', 'bias': 'ITL-3800C-098'}
-        dimensions = {'raw': Extent2I(4608, 4096),
-                      'bias': Extent2I(4072, 4000)}
-        sky_origin = unittest.SkipTest
-        raw_subsets = (({}, 1),
-                       ({'physical_filter': 'unknown~unknown'}, 1),
-                       ({'physical_filter': 'SDSSg'}, 0),
-                       ({'exposure.day_obs': 20180920}, 1),
-                       ({'exposure': 3018092000065}, 1),
-                       ({'exposure': 9999999999999}, 0),
-                       )
-        linearizer_type = unittest.SkipTest
-        self.setUp_butler_get(ccdExposureId_bits=ccdExposureId_bits,
-                              exposureIds=exposureIds,
-                              filters=filters,
-                              exptimes=exptimes,
-                              detectorIds=detectorIds,
-                              detector_names=detector_names,
-                              detector_serials=detector_serials,
-                              dimensions=dimensions,
-                              sky_origin=sky_origin,
-                              raw_subsets=raw_subsets,
-                              linearizer_type=linearizer_type
+        self.setUp_tests(self._butler, DATA_IDS)
+
+        self.setUp_butler_get(ccdExposureId_bits=CCD_EXPOSURE_ID_BITS,
+                              exposureIds=EXPOSURE_IDS,
+                              filters=FILTERS,
+                              exptimes=EXPTIMES,
+                              detectorIds=DETECTOR_IDS,
+                              detector_names=DETECTOR_NAMES,
+                              detector_serials=DETECTOR_SERIALS,
+                              dimensions=DIMENSIONS,
+                              sky_origin=unittest.SkipTest,
+                              raw_subsets=RAW_SUBSETS,
+                              linearizer_type=unittest.SkipTest
                               )
 
         self.raw_filename = '3018092000065-det000.fits'
@@ -54,21 +54,40 @@ class RubinDimensionPackerTestCase(unittest.TestCase):
     test_translators.py, since some translators now delegate to it.
     """
 
-    def setUp(self) -> None:
+    @classmethod
+    def setUpClass(cls) -> None:
+        # The tests only read from the registry, so create it and register
+        # the instruments once for the whole class.
         registry_config = RegistryConfig()
         registry_config["db"] = "sqlite://"
-        self.registry = SqlRegistry.createFromConfig(registry_config)
-        self.rubin_packer_instruments = [LsstCam, LsstComCam, LsstComCamSim,
-                                         Latiss]
-        self.old_packer_instruments = [
+        cls.registry = SqlRegistry.createFromConfig(registry_config)
+        cls.rubin_packer_instruments = [LsstCam, LsstComCam, LsstComCamSim,
+                                        LsstCamSim, Latiss]
+        cls.old_packer_instruments = [
             LsstCamImSim,
             LsstCamPhoSim,
             LsstTS8,
             LsstTS3,
             LsstUCDCam,
         ]
-        for cls in self.rubin_packer_instruments + self.old_packer_instruments:
-            cls().register(self.registry)
+        cls.instruments = {
+            instrument_cls: instrument_cls()
+            for instrument_cls in cls.rubin_packer_instruments + cls.old_packer_instruments
+        }
+        for instrument in cls.instruments.values():
+            instrument.register(cls.registry)
+        # Expanding a data ID queries the registry, so only do it once per
+        # instrument.
+        cls.instrument_data_ids = {
+            instrument.getName(): cls.registry.expandDataId(instrument=instrument.getName())
+            for instrument in cls.instruments.values()
+        }
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        del cls.instrument_data_ids
+        del cls.instruments
+        del cls.registry
 
     def check_rubin_dimension_packer(
         self,
@@ -117,7 +136,7 @@ class RubinDimensionPackerTestCase(unittest.TestCase):
                 not is_one_to_one_reinterpretation
             ), "Test should not infer visit_id in this case."
             visit_id = exposure_id
-        instrument_data_id = self.registry.expandDataId(instrument=instrument.getName())
+        instrument_data_id = self.instrument_data_ids[instrument.getName()]
         config = _TestConfig()
         packer = config.packer.apply(instrument_data_id, is_exposure=is_exposure)
         self.assertIsInstance(packer, RubinDimensionPacker)
@@ -171,7 +190,7 @@ class RubinDimensionPackerTestCase(unittest.TestCase):
         """Test that an Instrument's default dimension packer is still
         `lsst.pipe.base.ObservationDimensionPacker`.
         """
-        instrument_data_id = self.registry.expandDataId(instrument=instrument.getName())
+        instrument_data_id = self.instrument_data_ids[instrument.getName()]
         config = _TestConfig()
         packer = config.packer.apply(instrument_data_id, is_exposure=is_exposure)
         # This instrument still uses the pipe_base default dimension packer,
@@ -179,8 +198,7 @@ class RubinDimensionPackerTestCase(unittest.TestCase):
         self.assertIsInstance(packer, ObservationDimensionPacker)
 
     def test_latiss(self):
-        instrument = Latiss()
-        instrument.register(self.registry)
+        instrument = self.instruments[Latiss]
         # Input values obtained from:
         # $ butler query-dimension-records /repo/main exposure --where \
         #     "instrument='LATISS'" --limit 1
@@ -219,8 +237,7 @@ class RubinDimensionPackerTestCase(unittest.TestCase):
         )
 
     def test_lsstCam(self):
-        instrument = LsstCam()
-        instrument.register(self.registry)
+        instrument = self.instruments[LsstCam]
         # Input values obtained from:
         # $ butler query-dimension-records /repo/main exposure --where \
         #     "instrument='LSSTCam'" --limit 1
@@ -235,8 +252,7 @@ class RubinDimensionPackerTestCase(unittest.TestCase):
         )
 
     def test_comCam(self):
-        instrument = LsstComCam()
-        instrument.register(self.registry)
+        instrument = self.instruments[LsstComCam]
         # Input values obtained from:
         # $ butler query-dimension-records /repo/main exposure --where \
         #     "instrument='LSSTComCam'" --limit 1
@@ -250,8 +266,7 @@ class RubinDimensionPackerTestCase(unittest.TestCase):
         )
 
     def test_comCamSim(self):
-        instrument = LsstComCamSim()
-        instrument.register(self.registry)
+        instrument = self.instruments[LsstComCamSim]
         # Input values obtained from:
         # $ butler query-dimension-records data/input/comCamSim exposure \
         #      --where "instrument='LSSTComCamSim'" --limit 1
@@ -266,8 +281,7 @@ class RubinDimensionPackerTestCase(unittest.TestCase):
         )
 
     def test_lsstCamSim(self):
-        instrument = LsstCamSim()
-        instrument.register(self.registry)
+        instrument = self.instruments[LsstCamSim]
         # Input values obtained from:
         # $ butler query-dimension-records data/input/lsstCamSim exposure \
         #      --where "instrument='LSSTCamSim'" --limit 1
@@ -282,30 +296,25 @@ class RubinDimensionPackerTestCase(unittest.TestCase):
         )
 
     def test_imsim(self):
-        instrument = LsstCamImSim()
-        instrument.register(self.registry)
+        instrument = self.instruments[LsstCamImSim]
         self.check_old_dimension_packer(instrument, is_exposure=True)
         self.check_old_dimension_packer(instrument, is_exposure=False)
 
     def test_phosim(self):
-        instrument = LsstCamPhoSim()
-        instrument.register(self.registry)
+        instrument = self.instruments[LsstCamPhoSim]
         self.check_old_dimension_packer(instrument, is_exposure=True)
         self.check_old_dimension_packer(instrument, is_exposure=False)
 
     def test_ts3(self):
-        instrument = LsstTS3()
-        instrument.register(self.registry)
+        instrument = self.instruments[LsstTS3]
         self.check_old_dimension_packer(instrument, is_exposure=True)
 
     def test_ts8(self):
-        instrument = LsstTS8()
-        instrument.register(self.registry)
+        instrument = self.instruments[LsstTS8]
         self.check_old_dimension_packer(instrument, is_exposure=True)
 
     def test_ucdcam(self):
-        instrument = LsstUCDCam()
-        instrument.register(self.registry)
+        instrument = self.instruments[LsstUCDCam]
         self.check_old_dimension_packer(instrument, is_exposure=True)
 
 